@@ -1,12 +1,37 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import pwd
 import time
 import curses
 import signal
+import heapq
+import resource
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from operator import add, attrgetter, sub
 
 CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
+
+# the four /proc/meminfo fields get_memory_info() needs, found in one pass
+MEMINFO_FIELDS = re.compile(
+    rb"^(MemTotal|MemAvailable|SwapTotal|SwapFree):\s+(\d+)", re.M
+)
+
+# low / medium / high usage attributes, indexed by bar_color(); filled in
+# by init_color(), since color_pair() needs an initialized screen
+BAR_COLORS = []
+
+# cap on cached /proc/:pid descriptors (stat + statm per process): at most
+# half the RLIMIT_NOFILE soft limit, leaving the rest for the tty, the other
+# /proc files and the cmdline reads, and no more than 512 either way
+_nofile = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+if _nofile == resource.RLIM_INFINITY:
+    _nofile = 1024
+PID_FD_LIMIT = min(512, _nofile // 2)
 
 SIGNAL_MENU = [
     ("SIGTERM (15) — graceful termination", signal.SIGTERM),
@@ -27,6 +52,7 @@ def init_color():
     curses.init_pair(4, curses.COLOR_CYAN, -1)  # headers / separators
     curses.init_pair(5, curses.COLOR_WHITE, curses.COLOR_RED)  # errors
     curses.init_pair(6, curses.COLOR_BLACK, curses.COLOR_GREEN)  # success
+    BAR_COLORS[:] = [curses.color_pair(n) | curses.A_BOLD for n in (1, 2, 3)]
 
 
 def display_text(stdscr, row, col, text, attr=0):
@@ -49,121 +75,299 @@ def display_text(stdscr, row, col, text, attr=0):
 
 def bar_color(percent):
     """Return the curses attribute for a usage percentage"""
-    if percent > 80:
-        return curses.color_pair(3) | curses.A_BOLD
-    elif percent > 50:
-        return curses.color_pair(2) | curses.A_BOLD
-    return curses.color_pair(1) | curses.A_BOLD
+    # green up to 50%, yellow up to 80%, red above
+    return BAR_COLORS[(percent > 50) + (percent > 80)]
+
+
+@lru_cache(maxsize=4096)
+def bar_parts(tenths, width):
+    """
+    Returns the (fill, empty, "] 50.0%") strings of a bar at tenths of a
+    percent. There are only 1001 of those per width, so once the bars have
+    been drawn a few times every call is a cache hit.
+    """
+    percent = tenths / 10
+    fill = int(width * (percent / 100))
+    return "|" * fill, " " * (width - fill), f"] {percent:>5.1f}%"
 
 
 def draw_bar(stdscr, row, col, percent, width=20):
     """Returns a colored bar string like '[|||||     ] 50.0%'"""
     percent = max(0.0, min(100.0, percent))
-    fill = int(width * (percent / 100))
-    empty = width - fill
+    fill, empty, tail = bar_parts(round(percent * 10), width)
     color = bar_color(percent=percent)
 
     display_text(stdscr, row, col, "[")
-    display_text(stdscr, row, col + 1, "|" * fill, color)
-    display_text(stdscr, row, col + 1 + fill, " " * empty)
-    display_text(stdscr, row, col + 1 + width, f"] {percent:>5.1f}%")
+    display_text(stdscr, row, col + 1, fill, color)
+    display_text(stdscr, row, col + 1 + len(fill), empty)
+    display_text(stdscr, row, col + 1 + width, tail)
 
 
-def calculate_cpu_usage(curr, prev):  # -> float | Any:
-    """Calculate CPU usage % from two (total, idle) snapshots
-    Returns:
+class Proc:
+    """
+    One process, kept across updates and refreshed in place while it lives.
+    Slotted, since there is one per pid.
     """
-    total_d = curr[0] - prev[0]
-    idle_d = curr[1] - prev[1]
-    if total_d <= 0:
-        return 0.0
-    return ((total_d - idle_d) / total_d) * 100
 
+    __slots__ = (
+        "pid",
+        "name",
+        "state",
+        "ticks",
+        "cpu_time",
+        "uid",
+        "rss",
+        "cmdline",
+        "cpu_usage",
+        "starttime",
+    )
 
-def get_cpu_stats():  # -> dict | None:
+    def __init__(self, pid, name, state, ticks, uid, rss, starttime):
+        self.pid = pid
+        self.name = name
+        self.state = state
+        self.ticks = ticks
+        self.cpu_time = ticks / CLOCK_TICKS
+        self.uid = uid
+        self.rss = rss
+        self.cmdline = ""
+        self.cpu_usage = 0.0
+        self.starttime = starttime
+
+
+def calculate_cpu_usages(curr, prev):  # -> list[float]:
+    """Calculate CPU usage % for every cpu line of two get_cpu_stats() snapshots
+    Returns: usages in /proc/stat order, aggregate "cpu" first
     """
-    Reads /proc/stat.
+    names, totals, idles = curr
+    prev_names, prev_totals, prev_idles = prev
+
+    # cpu hotplug, positions no longer line up
+    if names != prev_names:
+        prev_totals = prev_idles = [0] * len(names)
+
+    return [
+        ((total_d - (idle - prev_idle)) / total_d) * 100
+        if (total_d := total - prev_total) > 0
+        else 0.0
+        for total, prev_total, idle, prev_idle in zip(
+            totals, prev_totals, idles, prev_idles
+        )
+    ]
+
+
+def read_fd(fd, size=8192):
     """
+    Reads a whole /proc file from offset 0 of an open fd.
+
+    procfs generates the content on read, so one big pread() gets a
+    consistent snapshot without going through the buffered io stack.
+    A short read is taken as the end of file, which holds for the files
+    read here; seq_file listings like /proc/:pid/smaps return a page at
+    a time and would need reading until b"".
+    """
+    data = os.pread(fd, size, 0)
+    if len(data) < size:
+        return data
+
+    # bigger than the buffer (e.g. /proc/stat on many cores)
+    chunks = [data]
+    offset = size
+    while data:
+        data = os.pread(fd, size, offset)
+        chunks.append(data)
+        offset += len(data)
+    return b"".join(chunks)
+
+
+def slurp(path, size=8192):
+    """Reads a whole /proc file as bytes"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return read_fd(fd, size)
+    finally:
+        os.close(fd)
 
-    stats = {}
 
+def read_proc(path, fds, limit=None):
+    """
+    Reads a /proc file through a descriptor kept open in fds.
+
+    procfs regenerates the content on every read at offset 0, so the
+    open()/close() pair is paid once instead of every tick. When fds
+    already holds `limit` descriptors the file is read with slurp().
+    """
+    fd = fds.get(path)
+    if fd is not None:
+        try:
+            return read_fd(fd)
+        except ProcessLookupError:
+            # the process behind it exited, so every fd cached for it is
+            # dead; the pid may already belong to a new process, which
+            # the fresh open below picks up
+            pid_dir = path.rpartition("/")[0] + "/"
+            for stale in [p for p in fds if p.startswith(pid_dir)]:
+                os.close(fds.pop(stale))
+        except OSError:
+            del fds[path]
+            os.close(fd)
+            raise
+
+    if limit is not None and len(fds) >= limit:
+        return slurp(path)
+    fd = fds[path] = os.open(path, os.O_RDONLY)
     try:
-        with open(f"/proc/stat") as f:
-            lines = f.readlines()
+        return read_fd(fd)
+    except OSError:
+        del fds[path]
+        os.close(fd)
+        raise
 
-            for line in lines:
-                if not line.startswith("cpu"):
-                    break
 
-                fields = line.split()
-                name = fields[0]
-                values = [float(x) for x in fields[1:]]
+def close_fds(fds, keep_pids=None):
+    """
+    Closes cached descriptors, or with keep_pids only the
+    /proc/:pid ones of processes that are gone.
+    """
+    for path in list(fds):
+        if keep_pids is None or path.split("/")[2] not in keep_pids:
+            os.close(fds.pop(path))
+
+
+def get_cpu_stats(fds):  # -> tuple[list, array, array]:
+    """
+    Reads /proc/stat.
+    Returns (names, totals, idles), aggregate "cpu" first. totals and idles
+    are int64 arrays, so a snapshot is two flat buffers, not a dict of tuples.
+    """
 
-                if len(values) >= 10:
-                    values[0] -= values[8]  # user -= guest
-                    values[1] -= values[9]  # nice -= guest_nice
+    try:
+        content = read_proc("/proc/stat", fds)
+
+        # the cpu lines come first with "intr" right after them, so cut
+        # the rest (intr, ctxt, btime, ...) off before splitting
+        head = content.split(b"\nintr", 1)[0]
+
+        # every cpu line has the same number of fields, so the split head is
+        # a table: column c of all lines is fields[c::stride], and each one
+        # gets converted and summed in C by map() instead of per line
+        fields = head.split()
+        stride = len(fields) // (head.count(b"\n") + 1)
+        names = [name.decode() for name in fields[::stride]]
+        # user nice system idle iowait irq softirq steal [guest guest_nice]
+        columns = [list(map(int, fields[c::stride])) for c in range(1, stride)]
+
+        # Total CPU Time = user + nice + system + idle + iowait + irq + softirq + steal
+        # minus guest / guest_nice, which user / nice already include
+        totals = columns[0]
+        for column in columns[1:8]:
+            totals = map(add, totals, column)
+        for column in columns[8:10]:
+            totals = map(sub, totals, column)
+        # idle + iowait
+        idles = map(add, columns[3], columns[4])
+
+        return names, array("q", totals), array("q", idles)
+    except (FileNotFoundError, PermissionError, ValueError, IndexError):
+        return [], array("q"), array("q")
+
+
+def get_pids(fds):
+    """
+    Lists the pid directories in /proc, through a /proc fd kept in fds.
 
-                # Total CPU Time = user + nice + system + idle + iowait + irq + softirq + steal
-                total_cpu_time = sum(values[:8])
-                # idle + iowait
-                idle_cpu_time = values[3] + values[4]
+    os.listdir() walks the getdents64 records in C and builds only the
+    names, cheaper than os.scandir() allocating a DirEntry for each.
+    """
+    fd = fds.get("/proc")
+    if fd is None:
+        fd = fds["/proc"] = os.open("/proc", os.O_RDONLY | os.O_DIRECTORY)
 
-                stats[name] = (total_cpu_time, idle_cpu_time)
-            return stats
-    except (FileNotFoundError, PermissionError, ValueError):
-        return {}
+    # only pid directories start with a digit
+    return [name for name in os.listdir(fd) if name[0] in "0123456789"]
 
 
-def get_process_info(pid):  # -> dict[str, Any] | None:
+def get_process_info(pid, fds, known=None):  # -> Proc | None:
     """
     Reads process details from /proc.
-    Returns dict {pid, name, state, ppid, user} or None on failure.
+    Returns a Proc or None on failure.
 
     Args:
         pid (str): process id
+        fds (dict): cached /proc/:pid descriptors, see read_proc()
+        known (Proc): this pid's Proc from the last update. If it is still
+            the same process it is updated in place and returned.
     """
     try:
-        with open(f"/proc/{pid}/stat") as f:
-            content = f.read()
+        content = read_proc(f"/proc/{pid}/stat", fds, PID_FD_LIMIT)
 
-        first_paran = content.find("(")
-        last_paran = content.rfind(")")
+        # the name may itself contain ")", so search from the right;
+        # it sits near the front, everything after it is the short tail
+        last_paran = content.rindex(b")")
+        first_paran = content.index(b"(", 0, last_paran)
 
         # instead of using /proc/:pid/comm, we can just
         # use /proc/:pid/stat to get it
-        name = content[first_paran + 1 : last_paran]
+        name = content[first_paran + 1 : last_paran].decode("utf-8", "replace")
 
-        fields = content[last_paran + 2 :].split()
-        state = fields[0]
+        # stop splitting once starttime (tail field 19) is out
+        fields = content[last_paran + 2 :].split(None, 20)
+        state = fields[0].decode()
         ticks = int(fields[11]) + int(fields[12])  # utime + stime
-
-        uid = None
-        rss = 0
-
-        with open(f"/proc/{pid}/status") as f:
-            for line in f:
-                if line.startswith("Uid:"):
-                    uid = int(line.split()[1])
-                elif line.startswith("VmRSS:"):
-                    rss = int(line.split()[1])
-
-        if uid is None:
-            return None
-
-        return {
-            "pid": pid,
-            "name": name,
-            "state": state,
-            "ticks": ticks,
-            "cpu_time": ticks / CLOCK_TICKS,
-            "uid": uid,
-            "rss": rss,
-        }
-
-    except (PermissionError, FileNotFoundError, ValueError, IndexError):
+        # jiffies after boot the process started, tells a reused pid apart
+        starttime = int(fields[19])
+
+        # second field of statm is resident pages
+        statm = read_proc(f"/proc/{pid}/statm", fds, PID_FD_LIMIT)
+        rss = int(statm.split(None, 2)[1]) * PAGE_KB
+
+        # /proc/:pid is owned by the process uid, so a stat() is
+        # much cheaper than scanning /proc/:pid/status for "Uid:";
+        # redone every update, setuid() keeps the pid and starttime
+        uid = os.stat(f"/proc/{pid}").st_uid
+
+        if known is not None and known.starttime == starttime:
+            known.name = name
+            known.state = state
+            known.ticks = ticks
+            known.cpu_time = ticks / CLOCK_TICKS
+            known.uid = uid
+            known.rss = rss
+            return known
+
+        return Proc(pid, name, state, ticks, uid, rss, starttime)
+
+    except (
+        PermissionError,
+        FileNotFoundError,
+        ProcessLookupError,
+        ValueError,
+        IndexError,
+    ):
         return None
 
 
+def sort_processes(procs, sort_key, count):
+    """
+    Returns the first `count` processes in sort_key order.
+
+    Only the visible window gets drawn, so heapq picks it out in
+    O(N log count) rather than sorting every process each frame.
+    """
+    if sort_key == "cpu":
+        return heapq.nlargest(count, procs, key=attrgetter("cpu_usage"))
+    elif sort_key == "mem":
+        return heapq.nlargest(count, procs, key=attrgetter("rss"))
+    elif sort_key == "pid":
+        return heapq.nsmallest(count, procs, key=lambda x: int(x.pid))
+    return heapq.nlargest(count, procs, key=attrgetter("cpu_time"))
+
+
+def get_users():
+    """Returns {uid: name} for every passwd entry, read in one pass"""
+    return {p.pw_uid: p.pw_name for p in pwd.getpwall()}
+
+
 def get_user(uid, cache):
     if uid in cache:
         return cache[uid]
@@ -175,30 +379,25 @@ def get_user(uid, cache):
     return user
 
 
-def get_memory_info():
+def get_memory_info(fds):
     """Returns (mem_total, mem_available, swap_total, swap_free) from /proc/meminfo"""
-    total_memory = available_memory = swap_total = swap_free = 0
-    with open("/proc/meminfo") as f:
-        for line in f:
-            if line.startswith("MemTotal:"):
-                total_memory = int(line.split()[1])
-            elif line.startswith("MemAvailable:"):
-                available_memory = int(line.split()[1])
-            elif line.startswith("SwapTotal:"):
-                swap_total = int(line.split()[1])
-            elif line.startswith("SwapFree:"):
-                swap_free = int(line.split()[1])
-    return total_memory, available_memory, swap_total, swap_free
+    fields = dict(MEMINFO_FIELDS.findall(read_proc("/proc/meminfo", fds)))
+    return (
+        int(fields.get(b"MemTotal", 0)),
+        int(fields.get(b"MemAvailable", 0)),
+        int(fields.get(b"SwapTotal", 0)),
+        int(fields.get(b"SwapFree", 0)),
+    )
 
 
+@lru_cache(maxsize=8192)
 def format_kb(kb):
     """Formats kB as human-readable string"""
     if kb < 1024:
         return f"{kb}K"
-    elif kb < 1024 * 1024:
-        return f"{kb / 1024:.1f}M"
-    else:
-        return f"{kb / (1024 * 1024):.1f}G"
+    # each unit is 10 more bits: 1 = M, 2 = G (and G beyond that)
+    unit = min(2, (kb.bit_length() - 1) // 10)
+    return f"{kb / (1 << 10 * unit):.1f}{'KMG'[unit]}"
 
 
 def format_time(seconds):
@@ -212,8 +411,8 @@ def format_time(seconds):
 
 def get_uptime():
     """Returns formatted uptime string"""
-    with open("/proc/uptime") as f:
-        total_seconds = float(f.read().split()[0])
+    # the clock /proc/uptime reports, without reading a file
+    total_seconds = time.clock_gettime(time.CLOCK_BOOTTIME)
 
     days = int(total_seconds // 86400)
     hours = int((total_seconds % 86400) // 3600)
@@ -225,19 +424,22 @@ def get_uptime():
     return f"{hours}:{minutes:02}:{seconds:02}"
 
 
-def get_loadavg():
+def get_loadavg(fds):
     """Returns load average string (1, 5, 15 min)"""
-    with open("/proc/loadavg") as f:
-        fields = f.read().split()
+    fields = read_proc("/proc/loadavg", fds).decode().split()
     return f"{fields[0]} {fields[1]} {fields[2]}"
 
 def get_cmdline(pid) -> str | None:
     """Returns the /proc/{pid}/cmdline"""
     try:
-        with open(f"/proc/{pid}/cmdline") as f:
-            cmdline = f.read();
-            return cmdline
-    except (PermissionError, FileNotFoundError, ValueError, IndexError):
+        return slurp(f"/proc/{pid}/cmdline").decode("utf-8", "replace")
+    except (
+        PermissionError,
+        FileNotFoundError,
+        ProcessLookupError,
+        ValueError,
+        IndexError,
+    ):
         pass
 
 def display_status(stdscr, message, attr=0):
@@ -330,8 +532,8 @@ def pick_signal(stdscr):
 
 def kill_prompt(stdscr, proc):
     """Kill flow using selected process."""
-    pid = int(proc["pid"])
-    proc_name = proc["name"]
+    pid = int(proc.pid)
+    proc_name = proc.name
 
     sig = pick_signal(stdscr)
     if sig is None:
@@ -360,14 +562,77 @@ def kill_prompt(stdscr, proc):
         display_status(stdscr, f" PID {pid}: {exc}", curses.color_pair(5))
 
 
+Layout = namedtuple(
+    "Layout",
+    "label_width bar_width avg_bar_width col_width sep hdr name_width row_format",
+)
+
+
+@lru_cache(maxsize=8)
+def get_layout(max_x, last_core, sort_key):
+    """
+    Widths and fixed strings for a terminal width, cached so steady-state
+    frames reuse them; a resize, cpu hotplug or new sort key is a new entry.
+
+    Args:
+        max_x (int): terminal width
+        last_core (str): highest core name, e.g. "cpu15" ("" for none)
+        sort_key (str): current sort column, marked in the header
+    """
+    label_width = max(len(f"CPU{last_core.replace('cpu', '')}"), 3)
+    bar_width = max(5, (max_x - 4 - 2 * (label_width + 11)) // 2)
+    avg_bar_width = 2 * bar_width + label_width + 13
+    col_width = label_width + 2 + bar_width + 9
+
+    sep = "=" * (max_x - 1)
+    name_width = max(4, max_x - 85)
+
+    pid_label = "▼PID" if sort_key == "pid" else "PID"
+    cpu_label = "▼%CPU" if sort_key == "cpu" else "%CPU"
+    mem_label = "▼%MEM" if sort_key == "mem" else "%MEM"
+    time_label = "▼TIME" if sort_key == "time" else "TIME"
+
+    hdr = (
+        f"{pid_label:>7} | {'USER':<12} | {cpu_label:>6} | "
+        f"{mem_label:>6} | {time_label:>8} | {'STATE':^5} | {'NAME':<16} | {'COMMAND':<{name_width}}"
+    )
+
+    row_format = (
+        "{:>7} | {:<12} | {:>5.1f}% | {:>5.1f}% | {:>8} | {:^5} | {:<16} | {:<"
+        + str(name_width)
+        + "}"
+    ).format
+
+    return Layout(
+        label_width,
+        bar_width,
+        avg_bar_width,
+        col_width,
+        sep,
+        hdr,
+        name_width,
+        row_format,
+    )
+
+
 def main(stdscr):
+    proc_fds = {}  # /proc/stat, /proc/meminfo, ...
+    pid_fds = {}  # /proc/:pid/stat and statm
+    try:
+        monitor(stdscr, proc_fds, pid_fds)
+    finally:
+        close_fds(proc_fds)
+        close_fds(pid_fds)
+
+
+def monitor(stdscr, proc_fds, pid_fds):
     init_color()
     curses.curs_set(0)
     stdscr.timeout(100)
 
-    prev_cpu_stats = get_cpu_stats()
-    prev_procs = {}
-    user_cache = {}
+    prev_cpu_stats = get_cpu_stats(proc_fds)
+    proc_cache = {}  # pid -> Proc from the last update
+    user_cache = get_users()
     cpu_count = os.cpu_count() or 1
 
     sort_key = "cpu"
@@ -382,10 +647,15 @@ def main(stdscr):
 
     last_update = 0
     update_interval = 1.0
+    last_user_refresh = time.monotonic()
+    user_refresh_interval = 60.0
+    last_loadavg_read = 0
+    loadavg_interval = 5.0  # the kernel recomputes load averages every 5s
+    cached_loadavg = ""
     cached_display_list = []
-    cached_cpu_usages = {}
+    cached_cpu_usages = []
     cached_global_usage = 0.0
-    cached_mem_total = 0
+    cached_meminfo = (0, 0, 0, 0)
 
     while True:
         stdscr.erase()
@@ -395,63 +665,62 @@ def main(stdscr):
 
         if max_y < 10 or max_x < 40:
             display_text(stdscr, 0, 0, "Terminal too small!", curses.A_BOLD)
+            wait_ms = -1  # nothing to refresh until a key or resize
         else:
             now = time.monotonic()
             need_update = (now - last_update) >= update_interval
             row = 0
 
-            curr_cpu_stats = get_cpu_stats()
-
-            cores = sorted(
-                [k for k in curr_cpu_stats if k != "cpu"],
-                key=lambda x: int(x.replace("cpu", "")),
-            )
-
-            if cores:
-                label_width = len(f"CPU{cores[-1].replace('cpu', '')}")
+            # frames drawn for a key press between updates reuse the last
+            # snapshots instead of re-reading /proc/stat and /proc/meminfo
+            if need_update:
+                curr_cpu_stats = get_cpu_stats(proc_fds)
+                cached_meminfo = get_memory_info(proc_fds)
             else:
-                label_width = 3
-            label_width = max(label_width, 3)
+                curr_cpu_stats = prev_cpu_stats
 
-            bar_width = max(5, (max_x - 4 - 2 * (label_width + 11)) // 2)
+            # /proc/stat already lists cores in ascending order
+            cores = curr_cpu_stats[0][1:]
 
-            agg_curr = curr_cpu_stats.get("cpu", (0, 0))
-            agg_prev = prev_cpu_stats.get("cpu", (0, 0))
+            layout = get_layout(max_x, cores[-1] if cores else "", sort_key)
+            label_width = layout.label_width
+            bar_width = layout.bar_width
 
             if need_update:
-                cached_global_usage = calculate_cpu_usage(agg_curr, agg_prev)
-
-                for core in cores:
-                    cached_cpu_usages[core] = calculate_cpu_usage(
-                        curr_cpu_stats[core],
-                        prev_cpu_stats.get(core, (0, 0)),
-                    )
+                usages = calculate_cpu_usages(curr_cpu_stats, prev_cpu_stats)
+                cached_global_usage = usages[0] if usages else 0.0
+                cached_cpu_usages = usages[1:]
 
-            avg_bar_width = 2 * bar_width + label_width + 13
+                if now - last_loadavg_read >= loadavg_interval:
+                    cached_loadavg = get_loadavg(proc_fds)
+                    last_loadavg_read = now
 
             display_text(stdscr, row, 2, f"{'AVG':<{label_width}}: ", curses.A_BOLD)
             draw_bar(
-                stdscr, row, 2 + label_width + 2, cached_global_usage, avg_bar_width
+                stdscr, row, 2 + label_width + 2, cached_global_usage, layout.avg_bar_width
             )
             row += 1
 
             half = (len(cores) + 1) // 2
-            col_width = label_width + 2 + bar_width + 9
 
             for i in range(half):
                 if row >= max_y:
                     break
 
                 left_name = cores[i]
-                left_usage = cached_cpu_usages.get(left_name, 0.0)
+                left_usage = (
+                    cached_cpu_usages[i] if i < len(cached_cpu_usages) else 0.0
+                )
                 display_text(stdscr, row, 2, f"{left_name.upper():<{label_width}}: ")
                 draw_bar(stdscr, row, 2 + label_width + 2, left_usage, bar_width)
 
                 j = i + half
                 if j < len(cores):
-                    rc = 2 + col_width + 2
+                    rc = 2 + layout.col_width + 2
                     right_name = cores[j]
-                    right_usage = cached_cpu_usages.get(right_name, 0.0)
+                    right_usage = (
+                        cached_cpu_usages[j] if j < len(cached_cpu_usages) else 0.0
+                    )
                     display_text(
                         stdscr, row, rc, f"{right_name.upper():<{label_width}}: "
                     )
@@ -459,7 +728,7 @@ def main(stdscr):
                 row += 1
 
             if row < max_y:
-                header = f"Uptime: {get_uptime()}  Load: {get_loadavg()}"
+                header = f"Uptime: {get_uptime()}  Load: {cached_loadavg}"
                 display_text(
                     stdscr,
                     row,
@@ -469,7 +738,7 @@ def main(stdscr):
                 )
                 row += 1
 
-            mem_total, mem_available, swap_total, swap_free = get_memory_info()
+            mem_total, mem_available, swap_total, swap_free = cached_meminfo
             mem_used = mem_total - mem_available
             mem_percent = (mem_used / mem_total) * 100 if mem_total else 0
             swap_used = swap_total - swap_free
@@ -501,29 +770,19 @@ def main(stdscr):
                 draw_bar(stdscr, row, len(lbl), swap_percent, 20)
                 row += 1
 
-            sep = "=" * (max_x - 1)
-            name_width = max(4, max_x - 85)
+            sep = layout.sep
+            name_width = layout.name_width
 
             if row < max_y:
                 display_text(stdscr, row, 0, sep, curses.color_pair(4))
                 row += 1
 
             if row < max_y:
-                pid_label = "▼PID" if sort_key == "pid" else "PID"
-                cpu_label = "▼%CPU" if sort_key == "cpu" else "%CPU"
-                mem_label = "▼%MEM" if sort_key == "mem" else "%MEM"
-                time_label = "▼TIME" if sort_key == "time" else "TIME"
-
-                hdr = (
-                    f"{pid_label:>7} | {'USER':<12} | {cpu_label:>6} | "
-                    f"{mem_label:>6} | {time_label:>8} | {'STATE':^5} | {'NAME':<16} | {'COMMAND':<{name_width}}"
-                )
-
                 display_text(
                     stdscr,
                     row,
                     0,
-                    hdr,
+                    layout.hdr,
                     curses.A_BOLD | curses.color_pair(4),
                 )
                 row += 1
@@ -533,52 +792,56 @@ def main(stdscr):
                 row += 1
 
             if need_update:
-                pids = [p for p in os.listdir("/proc") if p.isdigit()]
-                curr_procs_state = {}
-                sys_total_delta = max(1, agg_curr[0] - agg_prev[0])
+                # reload so new users show up and uid fallbacks get retried
+                if now - last_user_refresh >= user_refresh_interval:
+                    user_cache = get_users()
+                    last_user_refresh = now
+
+                pids = get_pids(proc_fds)
+                curr_proc_cache = {}
+                curr_totals, prev_totals = curr_cpu_stats[1], prev_cpu_stats[1]
+                sys_total_delta = 1
+                if curr_totals and prev_totals:
+                    sys_total_delta = max(1, curr_totals[0] - prev_totals[0])
 
                 for pid in pids:
-                    proc = get_process_info(pid)
+                    known = proc_cache.get(pid)
+                    if known is not None:
+                        prev_ticks = known.ticks
+
+                    proc = get_process_info(pid, pid_fds, known)
                     if not proc:
                         continue
-                    pid_int = int(proc["pid"])
-                    raw = get_cmdline(proc["pid"])
-                    proc["cmdline"] = raw.replace("\x00", " ").strip() if raw else ""
-                    prev_ticks = prev_procs.get(pid_int, None)
-                    if prev_ticks is not None:
-                        proc_delta = proc["ticks"] - prev_ticks
-                        proc["cpu_usage"] = (proc_delta / sys_total_delta) * 100 * cpu_count
-                    else:
-                        proc["cpu_usage"] = 0.0
-                    curr_procs_state[pid_int] = proc["ticks"]
+
+                    if proc is known:
+                        proc_delta = proc.ticks - prev_ticks
+                        proc.cpu_usage = (proc_delta / sys_total_delta) * 100 * cpu_count
+
+                    raw = get_cmdline(pid)
+                    proc.cmdline = raw.replace("\x00", " ").strip() if raw else ""
+                    curr_proc_cache[pid] = proc
                     display_list.append(proc)
 
-                if sort_key == "cpu":
-                    display_list.sort(key=lambda x: x["cpu_usage"], reverse=True)
-                elif sort_key == "mem":
-                    display_list.sort(key=lambda x: x["rss"], reverse=True)
-                elif sort_key == "pid":
-                    display_list.sort(key=lambda x: int(x["pid"]))
-                elif sort_key == "time":
-                    display_list.sort(key=lambda x: x["cpu_time"], reverse=True)
+                close_fds(pid_fds, keep_pids=set(pids))
 
                 if search_query:
                     display_list = [
                         p for p in display_list
-                        if search_query in p["name"].lower()
-                        or search_query in p.get("cmdline", "").lower()
-                        or search_query in str(p["pid"])
-                        or search_query in get_user(p["uid"], user_cache).lower()
+                        if search_query in p.name.lower()
+                        or search_query in p.cmdline.lower()
+                        or search_query in str(p.pid)
+                        or search_query in get_user(p.uid, user_cache).lower()
                     ]
 
                 cached_display_list = display_list
-                cached_mem_total = mem_total
                 prev_cpu_stats = curr_cpu_stats
-                prev_procs = curr_procs_state
-                last_update = now
-            else:
-                display_list = cached_display_list
-                mem_total = cached_mem_total
+                proc_cache = curr_proc_cache
+                # stay on a fixed cadence: getch() wakes a little after the
+                # deadline, and anchoring on now would add that to every
+                # interval; forced updates (last_update = 0) or updates more
+                # than an interval late restart the cadence from now instead
+                deadline = last_update + update_interval
+                last_update = deadline if now - deadline < update_interval else now
 
             footer_rows = 2
             max_proc_rows = max(0, max_y - row - footer_rows)
@@ -588,6 +851,12 @@ def main(stdscr):
             else:
                 selected_idx = 0
 
+            # sorted up to the last visible row (or the selection, after a resize)
+            display_list = sort_processes(
+                cached_display_list,
+                sort_key,
+                max(scroll_offset + max_proc_rows, selected_idx + 1),
+            )
             visible_list = display_list[scroll_offset: scroll_offset + max_proc_rows]
             for list_idx, proc in enumerate(visible_list):
                 if row >= max_y - footer_rows:
@@ -596,10 +865,10 @@ def main(stdscr):
                 abs_idx = scroll_offset + list_idx
                 is_selected = (abs_idx == selected_idx)
 
-                user = get_user(proc["uid"], user_cache)
-                name = proc["name"]
-                cmdline = proc.get("cmdline", "")
-                proc_mem = (proc["rss"] / mem_total) * 100 if mem_total else 0
+                user = get_user(proc.uid, user_cache)
+                name = proc.name
+                cmdline = proc.cmdline
+                proc_mem = (proc.rss / mem_total) * 100 if mem_total else 0
 
                 if len(user) > 12:
                     user = user[:11] + "~"
@@ -608,17 +877,22 @@ def main(stdscr):
                 if len(cmdline) > name_width:
                     cmdline = cmdline[: name_width - 1] + "…"
 
-                line = (
-                    f"{proc['pid']:>7} | {user:<12} | {proc['cpu_usage']:>5.1f}% "
-                    f"| {proc_mem:>5.1f}% | {format_time(proc['cpu_time']):>8} "
-                    f"| {proc['state']:^5} | {name:<16} | {cmdline:<{name_width}}"
+                line = layout.row_format(
+                    proc.pid,
+                    user,
+                    proc.cpu_usage,
+                    proc_mem,
+                    format_time(proc.cpu_time),
+                    proc.state,
+                    name,
+                    cmdline,
                 )
 
                 if is_selected:
                     attr = curses.A_REVERSE | curses.A_BOLD
-                elif proc["cpu_usage"] > 50:
+                elif proc.cpu_usage > 50:
                     attr = curses.color_pair(3) | curses.A_BOLD
-                elif proc["cpu_usage"] > 10:
+                elif proc.cpu_usage > 10:
                     attr = curses.color_pair(2)
                 else:
                     attr = curses.color_pair(1)
@@ -626,7 +900,7 @@ def main(stdscr):
                 display_text(stdscr, row, 0, line, attr)
                 row += 1
 
-            if not display_list and search_query:
+            if not cached_display_list and search_query:
                 display_text(stdscr, row, 2,
                             f"No processes matching '{search_query}'",
                             curses.color_pair(3) | curses.A_BOLD)
@@ -654,14 +928,23 @@ def main(stdscr):
                 else:
                     search_info = f" Filter: '{search_query}' (\\=clear)" if search_query else ""
                     status = (
-                        f" Tasks: {len(display_list)}{search_info} | "
+                        f" Tasks: {len(cached_display_list)}{search_info} | "
                         f"Sort: {sort_labels[sort_key]} (P=CPU M=Mem N=PID T=Time) "
                         f"| ↑↓=Select k=Kill /=Search | q=Quit"
                     )
 
                     display_text(stdscr, footer_row + 1, 0, status, curses.A_BOLD)
 
+            # sleep in getch() until a key arrives or the next update is due
+            # instead of redrawing every 100ms; between those nothing on
+            # screen changes, and refresh() only sends the changed cells
+            # (rounded up, so it doesn't wake just short of the deadline and
+            # redraw an extra frame with nothing new)
+            wait = last_update + update_interval - time.monotonic()
+            wait_ms = max(0, int(wait * 1000) + 1)
+
         stdscr.refresh()
+        stdscr.timeout(wait_ms)
 
         # trigger warning - incoming terrible looking if else chain
 
@@ -723,8 +1006,8 @@ def main(stdscr):
             scroll_offset = 0
             last_update = 0
         elif key in (ord("K"), ord("k")):
-            if cached_display_list and 0 <= selected_idx < len(cached_display_list):
-                kill_prompt(stdscr, cached_display_list[selected_idx])
+            if 0 <= selected_idx < len(display_list):
+                kill_prompt(stdscr, display_list[selected_idx])
                 last_update = 0
         elif key == curses.KEY_UP:
             selected_idx = max(0, selected_idx - 1)